@@ -3,14 +3,276 @@
 HTTP Client Library Adapters
 
 """
+import os
+import ssl
 from abc import ABCMeta, abstractmethod
 
 import requests
 import requests.exceptions
+import six
+from requests.adapters import HTTPAdapter
 
-from hvac import utils
+from hvac import exceptions, utils
+
+try:
+    import httpx
+    has_httpx = True
+except ImportError:
+    has_httpx = False
 
 DEFAULT_BASE_URI = 'http://localhost:8200'
+DEFAULT_POOL_CONNECTIONS = 100
+DEFAULT_POOL_MAXSIZE = 100
+DEFAULT_ACCEPT_ENCODING = 'gzip, deflate'
+DEFAULT_HTTPX_MAX_KEEPALIVE_CONNECTIONS = 20
+
+
+def _build_httpx_ssl_context(cert, verify):
+    """Convert the requests-style cert and verify arguments into the verify value accepted by httpx.
+
+    httpx deprecates CA bundle paths for verify and the cert argument, so both are loaded into an SSL context instead.
+
+    :param cert: Certificates for use in requests sent to the Vault instance. This should be a tuple with the
+        certificate and then key, or the path of a single file containing both.
+    :type cert: tuple | str
+    :param verify: Whether TLS verification should be performed, a path to the CA bundle (or directory of CA
+        certificates) to use for verification or the SSL context to use.
+    :type verify: Union[bool,str,ssl.SSLContext]
+    :return: The verify argument for the httpx client or transport.
+    :rtype: Union[bool,ssl.SSLContext]
+    """
+    if isinstance(verify, ssl.SSLContext) or (not cert and not isinstance(verify, six.string_types)):
+        return verify
+
+    if verify is False:
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+    else:
+        if verify is True:
+            # Trust the same CA bundle the requests based adapters use by default.
+            verify = requests.utils.DEFAULT_CA_BUNDLE_PATH
+        if os.path.isdir(verify):
+            ssl_context = ssl.create_default_context(capath=verify)
+        else:
+            ssl_context = ssl.create_default_context(cafile=verify)
+
+    if cert:
+        if isinstance(cert, six.string_types):
+            ssl_context.load_cert_chain(cert)
+        else:
+            ssl_context.load_cert_chain(*cert)
+
+    return ssl_context
+
+
+def _build_httpx_client_kwargs(cert, verify, timeout, proxies, transport_class):
+    """Build the keyword arguments used to construct a HTTP/2 capable httpx client instance.
+
+    :param cert: Certificates for use in requests sent to the Vault instance.
+    :type cert: tuple
+    :param verify: Whether TLS verification should be performed, a path to the CA bundle to use for verification or the
+        SSL context to use.
+    :type verify: Union[bool,str,ssl.SSLContext]
+    :param timeout: The timeout value for requests sent to Vault.
+    :type timeout: int
+    :param proxies: Proxies to use when preforming requests, in the same format accepted by the requests module.
+    :type proxies: dict
+    :param transport_class: The httpx transport class used for proxied connections, i.e. httpx.HTTPTransport or
+        httpx.AsyncHTTPTransport.
+    :type transport_class: type
+    :return: Keyword arguments for the httpx.Client or httpx.AsyncClient constructor.
+    :rtype: dict
+    """
+    transport_kwargs = {
+        'verify': _build_httpx_ssl_context(cert, verify),
+        'http2': True,
+        'limits': httpx.Limits(
+            max_keepalive_connections=DEFAULT_HTTPX_MAX_KEEPALIVE_CONNECTIONS,
+            max_connections=DEFAULT_POOL_MAXSIZE,
+        ),
+    }
+    client_kwargs = dict(transport_kwargs, timeout=timeout)
+    if proxies:
+        # requests keys proxies by scheme (e.g. "https"), httpx mounts transports by URL pattern (e.g. "https://").
+        client_kwargs['mounts'] = {
+            key if '://' in key else key + '://': transport_class(proxy=httpx.Proxy(proxy), **transport_kwargs)
+            for key, proxy in proxies.items()
+        }
+    return client_kwargs
+
+
+def _validate_ssl_context(ssl_context, session, cert, verify):
+    """Reject an ssl_context adapter argument combined with arguments it would conflict with.
+
+    :param ssl_context: The SSL context passed to the adapter, if any.
+    :type ssl_context: ssl.SSLContext
+    :param session: The session or client passed to the adapter, if any.
+    :type session: requests.Session | httpx.Client | httpx.AsyncClient
+    :param cert: The cert argument passed to the adapter.
+    :type cert: tuple
+    :param verify: The verify argument passed to the adapter.
+    :type verify: Union[bool,str]
+    """
+    if ssl_context is None:
+        return
+    if session:
+        raise exceptions.ParamValidationError('ssl_context cannot be combined with a provided session')
+    if cert is not None or verify is not True:
+        raise exceptions.ParamValidationError(
+            'ssl_context cannot be combined with the cert or verify arguments; configure them on the SSL context instead'
+        )
+
+
+def _prepare_request(adapter, url, headers, kwargs, session_headers):
+    """Apply the Vault URL and header conventions shared by all adapters to an outgoing request.
+
+    :param adapter: The adapter performing the request.
+    :type adapter: hvac.adapters.Adapter | hvac.async_adapters.AsyncAdapter
+    :param url: Partial URL path to send the request to.
+    :type url: str | unicode
+    :param headers: Additional headers to include with the request.
+    :type headers: dict
+    :param kwargs: Keyword arguments passed to the adapter's request method.
+    :type kwargs: dict
+    :param session_headers: Headers the adapter's session or client sends with every request.
+    :type session_headers: collections.Mapping
+    :return: The full URL, the request headers and the keyword arguments for the HTTP library call.
+    :rtype: tuple
+    """
+    while '//' in url:
+        # Vault CLI treats a double forward slash ('//') as a single forward slash for a given path.
+        # To avoid issues with the requests module's redirection logic, we perform the same translation here.
+        url = url.replace('//', '/')
+
+    url = Adapter.urljoin(adapter.base_uri, url)
+
+    if not headers:
+        headers = {}
+
+    if adapter.token:
+        headers['X-Vault-Token'] = adapter.token
+
+    if adapter.namespace:
+        headers['X-Vault-Namespace'] = adapter.namespace
+
+    # Ask Vault for compressed responses unless the session or caller already negotiates its own encodings.
+    if 'Accept-Encoding' not in session_headers and 'Accept-Encoding' not in headers:
+        headers['Accept-Encoding'] = DEFAULT_ACCEPT_ENCODING
+
+    _kwargs = adapter._kwargs.copy()
+    _kwargs.update(kwargs)
+
+    wrap_ttl = _kwargs.pop('wrap_ttl', None)
+    if wrap_ttl:
+        headers['X-Vault-Wrap-TTL'] = str(wrap_ttl)
+
+    return url, headers, _kwargs
+
+
+def _raise_for_response(adapter, method, url, response, is_success, raise_exception):
+    """Raise the hvac exception matching an unsuccessful response, unless exceptions are disabled.
+
+    :param adapter: The adapter that performed the request.
+    :type adapter: hvac.adapters.Adapter | hvac.async_adapters.AsyncAdapter
+    :param method: HTTP method used with the request.
+    :type method: str
+    :param url: The full URL of the request.
+    :type url: str | unicode
+    :param response: The response of the request.
+    :type response: requests.Response | httpx.Response
+    :param is_success: Whether the response status code indicates success.
+    :type is_success: bool
+    :param raise_exception: If False, never raise.
+    :type raise_exception: bool
+    """
+    if is_success or not raise_exception or adapter.ignore_exceptions:
+        return
+    text = errors = None
+    if response.headers.get('Content-Type') == 'application/json':
+        try:
+            errors = response.json().get('errors')
+        except Exception:
+            pass
+    if errors is None:
+        text = response.text
+    utils.raise_for_error(
+        method,
+        url,
+        response.status_code,
+        text,
+        errors=errors
+    )
+
+
+def _json_or_response(response):
+    """Return the decoded JSON body of HTTP 200 responses, otherwise the response itself.
+
+    :param response: The response of a request.
+    :type response: requests.Response | httpx.Response
+    :return: Dict on HTTP 200 with JSON body, otherwise the response object.
+    :rtype: dict | requests.Response | httpx.Response
+    """
+    if response.status_code == 200:
+        try:
+            return response.json()
+        except ValueError:
+            pass
+
+    return response
+
+
+def _httpx_send_kwargs(kwargs):
+    """Translate requests-style keyword arguments into those accepted by httpx's build_request().
+
+    :param kwargs: Keyword arguments for the HTTP library call, as produced by _prepare_request.
+    :type kwargs: dict
+    :return: Whether the response should be streamed, and the keyword arguments for build_request().
+    :rtype: tuple
+    """
+    unsupported = sorted(set(kwargs) & {'cert', 'verify', 'proxies'})
+    if unsupported:
+        error_msg = 'unsupported per-request argument(s) for httpx adapters: {args}; pass them to the adapter constructor'
+        raise exceptions.ParamValidationError(error_msg.format(args=', '.join(unsupported)))
+    _kwargs = dict(kwargs)
+    stream = _kwargs.pop('stream', False)
+    if isinstance(_kwargs.get('data'), (bytes, six.text_type)):
+        # httpx only accepts form fields as data; raw bodies (e.g. raft snapshots) are passed as content.
+        _kwargs['content'] = _kwargs.pop('data')
+    return stream, _kwargs
+
+
+class _SSLContextHTTPAdapter(HTTPAdapter):
+    """Requests transport adapter that establishes HTTPS connections with a caller-provided ssl.SSLContext."""
+
+    def __init__(self, ssl_context, **kwargs):
+        # Must be set before HTTPAdapter.__init__() as that is what calls init_poolmanager().
+        self.ssl_context = ssl_context
+        super(_SSLContextHTTPAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['ssl_context'] = self.ssl_context
+        return super(_SSLContextHTTPAdapter, self).init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, *args, **kwargs):
+        kwargs['ssl_context'] = self.ssl_context
+        return super(_SSLContextHTTPAdapter, self).proxy_manager_for(*args, **kwargs)
+
+    # Verification settings and client certificates come from the SSL context alone. The overrides below stop requests
+    # from having urllib3 load its CA bundle (or REQUESTS_CA_BUNDLE) into the context, or reset its verify_mode.
+
+    def cert_verify(self, conn, url, verify, cert):
+        if url.lower().startswith('https'):
+            conn.cert_reqs = self.ssl_context.verify_mode
+
+    def build_connection_pool_key_attributes(self, request, verify, cert=None):
+        host_params, pool_kwargs = super(_SSLContextHTTPAdapter, self).build_connection_pool_key_attributes(
+            request,
+            True,
+            cert=None,
+        )
+        pool_kwargs['cert_reqs'] = self.ssl_context.verify_mode
+        return host_params, pool_kwargs
 
 
 class Adapter(object):
@@ -18,7 +280,7 @@ class Adapter(object):
     __metaclass__ = ABCMeta
 
     def __init__(self, base_uri=DEFAULT_BASE_URI, token=None, cert=None, verify=True, timeout=30, proxies=None,
-                 allow_redirects=True, session=None, namespace=None, ignore_exceptions=False):
+                 allow_redirects=True, session=None, namespace=None, ignore_exceptions=False, ssl_context=None):
         """Create a new request adapter instance.
 
         :param base_uri: Base URL for the Vault instance being addressed.
@@ -38,16 +300,40 @@ class Adapter(object):
         :type proxies: dict
         :param allow_redirects: Whether to follow redirects when sending requests to Vault.
         :type allow_redirects: bool
-        :param session: Optional session object to use when performing request.
+        :param session: Optional session object to use when performing request. If none is provided, a session with a
+            pool of up to DEFAULT_POOL_MAXSIZE keep-alive connections per host is created.
         :type session: request.Session
         :param namespace: Optional Vault Namespace.
         :type namespace: str
         :param ignore_exceptions: If True, _always_ return the response object for a given request. I.e., don't raise an exception
             based on response status code, etc.
         :type ignore_exceptions: bool
+        :param ssl_context: Optional SSL context to use for HTTPS connections, e.g. to require TLS 1.3 where the Vault
+            server supports it::
+
+                ssl_context = ssl.create_default_context()
+                ssl_context.minimum_version = ssl.TLSVersion.TLSv1_3
+
+            The context replaces the verify and cert parameters: load any custom CA bundle and client certificate into
+            it instead. It only applies to the session created by the adapter, so it cannot be combined with the
+            session, verify or cert parameters.
+        :type ssl_context: ssl.SSLContext
         """
+        _validate_ssl_context(ssl_context, session, cert, verify)
         if not session:
             session = requests.Session()
+            # Reuse established TCP/TLS connections across requests instead of the requests default of 10 per host.
+            pool_kwargs = {
+                'pool_connections': DEFAULT_POOL_CONNECTIONS,
+                'pool_maxsize': DEFAULT_POOL_MAXSIZE,
+                'max_retries': 0,
+            }
+            if ssl_context is None:
+                pool_adapter = HTTPAdapter(**pool_kwargs)
+            else:
+                pool_adapter = _SSLContextHTTPAdapter(ssl_context=ssl_context, **pool_kwargs)
+            session.mount('http://', pool_adapter)
+            session.mount('https://', pool_adapter)
 
         self.base_uri = base_uri
         self.token = token
@@ -261,28 +547,7 @@ class RawAdapter(Adapter):
         :return: The response of the request.
         :rtype: requests.Response
         """
-        while '//' in url:
-            # Vault CLI treats a double forward slash ('//') as a single forward slash for a given path.
-            # To avoid issues with the requests module's redirection logic, we perform the same translation here.
-            url = url.replace('//', '/')
-
-        url = self.urljoin(self.base_uri, url)
-
-        if not headers:
-            headers = {}
-
-        if self.token:
-            headers['X-Vault-Token'] = self.token
-
-        if self.namespace:
-            headers['X-Vault-Namespace'] = self.namespace
-
-        wrap_ttl = kwargs.pop('wrap_ttl', None)
-        if wrap_ttl:
-            headers['X-Vault-Wrap-TTL'] = str(wrap_ttl)
-
-        _kwargs = self._kwargs.copy()
-        _kwargs.update(kwargs)
+        url, headers, _kwargs = _prepare_request(self, url, headers, kwargs, self.session.headers)
 
         response = self.session.request(
             method=method,
@@ -292,22 +557,7 @@ class RawAdapter(Adapter):
             **_kwargs
         )
 
-        if not response.ok and (raise_exception and not self.ignore_exceptions):
-            text = errors = None
-            if response.headers.get('Content-Type') == 'application/json':
-                try:
-                    errors = response.json().get('errors')
-                except Exception:
-                    pass
-            if errors is None:
-                text = response.text
-            utils.raise_for_error(
-                method,
-                url,
-                response.status_code,
-                text,
-                errors=errors
-            )
+        _raise_for_response(self, method, url, response, response.ok, raise_exception)
 
         return response
 
@@ -336,17 +586,110 @@ class JSONAdapter(RawAdapter):
         :type args: list
         :param kwargs: Keyword arguments to pass to RawAdapter.request.
         :type kwargs: dict
-        :return: Dict on HTTP 200 with JSON body, otherwise the response object.
+        :return: Dict on HTTP 200 with JSON body, otherwise the response object. Streamed responses (stream=True) are
+            always returned as the response object so the body can be consumed incrementally.
         :rtype: dict | requests.Response
         """
         response = super(JSONAdapter, self).request(*args, **kwargs)
-        if response.status_code == 200:
-            try:
-                return response.json()
-            except ValueError:
-                pass
+        if kwargs.get('stream'):
+            return response
 
-        return response
+        return _json_or_response(response)
+
+
+class HTTPXAdapter(Adapter):
+    """
+    The HTTPXAdapter adapter class.
+    This adapter behaves like the JSONAdapter adapter, but performs requests with a HTTP/2 enabled httpx.Client so
+    concurrent requests (e.g. from several threads) are multiplexed over a single TLS connection.
+    Requires the optional httpx dependency (``pip install hvac[async]``).
+    """
+
+    def __init__(self, base_uri=DEFAULT_BASE_URI, token=None, cert=None, verify=True, timeout=30, proxies=None,
+                 allow_redirects=True, session=None, namespace=None, ignore_exceptions=False, ssl_context=None):
+        """Create a new httpx request adapter instance.
+
+        See :py:meth:`hvac.adapters.Adapter.__init__` for parameter details.
+
+        :param session: Optional client object to use when performing requests.
+        :type session: httpx.Client
+        :param ssl_context: Optional SSL context to use for HTTPS connections. The context replaces the verify and cert
+            parameters: load any custom CA bundle and client certificate into it instead. Cannot be combined with the
+            session, verify or cert parameters.
+        :type ssl_context: ssl.SSLContext
+        """
+        _validate_ssl_context(ssl_context, session, cert, verify)
+        if not session:
+            if not has_httpx:
+                raise ImportError('httpx is required for the HTTPXAdapter')
+            if ssl_context is not None:
+                verify = ssl_context
+            session = httpx.Client(**_build_httpx_client_kwargs(cert, verify, timeout, proxies, httpx.HTTPTransport))
+
+        super(HTTPXAdapter, self).__init__(
+            base_uri=base_uri,
+            token=token,
+            timeout=timeout,
+            allow_redirects=allow_redirects,
+            session=session,
+            namespace=namespace,
+            ignore_exceptions=ignore_exceptions,
+        )
+
+        # Certificates, verification and proxies are properties of the httpx client rather than of each request.
+        self._kwargs = {
+            'timeout': timeout,
+        }
+
+    def get_login_token(self, response):
+        """Extracts the client token from a login response.
+
+        :param response: The response object returned by the login method.
+        :type response: dict | httpx.Response
+        :return: A client token.
+        :rtype: str
+        """
+        return response['auth']['client_token']
+
+    def request(self, method, url, headers=None, raise_exception=True, **kwargs):
+        """Main method for routing HTTP requests to the configured Vault base_uri.
+
+        :param method: HTTP method to use with the request. E.g., GET, POST, etc.
+        :type method: str
+        :param url: Partial URL path to send the request to. This will be joined to the end of the instance's base_uri
+            attribute.
+        :type url: str | unicode
+        :param headers: Additional headers to include with the request.
+        :type headers: dict
+        :param raise_exception: If True, raise an exception via utils.raise_for_error(). Set this parameter to False to
+            bypass this functionality.
+        :type raise_exception: bool
+        :param kwargs: Additional keyword arguments to include in the httpx call. The requests-style stream argument and
+            raw (bytes or text) data bodies are translated to their httpx equivalents.
+        :type kwargs: dict
+        :return: Dict on HTTP 200 with JSON body, otherwise the response object. Streamed responses (stream=True) are
+            always returned as the response object so the body can be consumed incrementally.
+        :rtype: dict | httpx.Response
+        """
+        url, headers, _kwargs = _prepare_request(self, url, headers, kwargs, self.session.headers)
+        stream, _kwargs = _httpx_send_kwargs(_kwargs)
+
+        request = self.session.build_request(
+            method=method.upper(),
+            url=url,
+            headers=headers,
+            **_kwargs
+        )
+        response = self.session.send(request, stream=stream, follow_redirects=self.allow_redirects)
+
+        if stream and not response.is_success:
+            response.read()
+        _raise_for_response(self, method, url, response, response.is_success, raise_exception)
+
+        if stream:
+            return response
+
+        return _json_or_response(response)
 
 
 # Retaining the legacy name
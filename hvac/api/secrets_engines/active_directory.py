@@ -1,11 +1,65 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 """Active Directory methods module."""
+import copy
+import threading
 
 from hvac import utils
 from hvac.api.vault_api_base import VaultApiBase
 
+try:
+    import cachetools
+    has_cachetools = True
+except ImportError:
+    has_cachetools = False
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+    has_futures = True
+except ImportError:
+    has_futures = False
+
+try:
+    import ijson
+    has_ijson = True
+except ImportError:
+    has_ijson = False
+
 DEFAULT_MOUNT_POINT = 'ad'
+DEFAULT_CACHE_MAXSIZE = 1024
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_MAX_PRIME_WORKERS = 100
+
+_CONFIG_PATH = '/v1/{mount_point}/config'
+_ROLES_PATH = '/v1/{}/roles'
+_ROLE_PATH = '/v1/{}/roles/{}'
+_STREAM_CHUNK_SIZE = 8192
+
+
+class _ChunkReader(object):
+    """Minimal file-like wrapper exposing an iterator of decoded body chunks through read(), as expected by ijson."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._buffer = b''
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def _iter_response_chunks(response):
+    """Iterate over the decoded body of a streamed requests or httpx response."""
+    if hasattr(response, 'iter_bytes'):
+        return response.iter_bytes(chunk_size=_STREAM_CHUNK_SIZE)
+    return response.iter_content(chunk_size=_STREAM_CHUNK_SIZE)
 
 
 class ActiveDirectory(VaultApiBase):
@@ -13,6 +67,95 @@ class ActiveDirectory(VaultApiBase):
     Reference: https://www.vaultproject.io/api/secret/ad/index.html
     """
 
+    def __init__(self, adapter, cache_ttl=None):
+        """Create a new ActiveDirectory instance.
+
+        :param adapter: Instance of :py:class:`hvac.adapters.Adapter`; used for performing HTTP requests.
+        :type adapter: hvac.adapters.Adapter
+        :param cache_ttl: Optional number of seconds to cache the JSON responses of read and list methods for.
+            Responses are not cached by default. Cached responses are kept per token and namespace, and methods that
+            modify a config or role evict the affected responses. Requires the cachetools package. The instance exposed
+            as ``Client.secrets.activedirectory`` never caches; construct ActiveDirectory directly to use this, e.g.
+            ``ActiveDirectory(adapter=client.adapter, cache_ttl=60)``.
+        :type cache_ttl: int | float
+        """
+        super(ActiveDirectory, self).__init__(adapter=adapter)
+        self._cache = None
+        self._cache_lock = threading.RLock()
+        if cache_ttl is not None:
+            if not has_cachetools:
+                raise ImportError('cachetools is required for response caching')
+            self._cache = cachetools.TTLCache(maxsize=DEFAULT_CACHE_MAXSIZE, ttl=cache_ttl)
+
+    def _cached_request(self, cache_key, request, **kwargs):
+        """Return the cached response for cache_key, performing and caching the request on a miss.
+
+        Only JSON (dict) responses are cached, and callers always receive their own copy.
+
+        :param cache_key: Tuple of the method name and the arguments identifying the requested resource.
+        :type cache_key: tuple
+        :param request: The adapter method to call on a cache miss.
+        :type request: callable
+        :param kwargs: Keyword arguments to pass to the request method.
+        :type kwargs: dict
+        :return: The (possibly cached) response of the request.
+        :rtype: dict | requests.Response
+        """
+        if self._cache is None:
+            return request(**kwargs)
+        # Responses are only valid for the token (and namespace) that Vault authorized them for.
+        cache_key = (self._adapter.token, self._adapter.namespace) + cache_key
+        with self._cache_lock:
+            response = self._cache.get(cache_key)
+        if response is None:
+            response = request(**kwargs)
+            if not isinstance(response, dict):
+                return response
+            with self._cache_lock:
+                self._cache[cache_key] = copy.deepcopy(response)
+            return response
+        return copy.deepcopy(response)
+
+    def _evict_cached(self, *cache_keys):
+        """Remove the provided keys from the response cache for every token and namespace, if enabled.
+
+        :param cache_keys: Keys previously passed to _cached_request.
+        :type cache_keys: tuple
+        """
+        if self._cache is None:
+            return
+        with self._cache_lock:
+            for cache_key in list(self._cache):
+                if cache_key[2:] in cache_keys:
+                    self._cache.pop(cache_key, None)
+
+    def prime(self, n=1):
+        """Establish up to n pooled connections to the Vault server ahead of the first ad request.
+
+        Issues HEAD requests to the health endpoint so that the TCP and TLS handshakes are paid up front and later
+        requests reuse already established keep-alive connections. For n > 1 the requests are sent from a thread pool
+        of at most DEFAULT_MAX_PRIME_WORKERS threads; a new connection is only opened for each request that
+        overlaps with another in flight, so this is best effort. Set n to the expected request parallelism (e.g. the
+        max_workers used with read_roles_bulk); n=0 is a no-op.
+
+        Supported methods:
+            HEAD: /sys/health. Produces: 200 (empty body)
+
+        :param n: The number of connections to establish.
+        :type n: int
+        """
+        def check_health(_=None):
+            self._adapter.head('/v1/sys/health', raise_exception=False)
+
+        if n <= 1 or not has_futures:
+            for _ in range(n):
+                check_health()
+            return
+
+        with ThreadPoolExecutor(max_workers=min(n, DEFAULT_MAX_PRIME_WORKERS)) as executor:
+            # Consume the results so any connection error is re-raised here.
+            list(executor.map(check_health, range(n)))
+
     def configure(self, binddn=None, bindpass=None, url=None, userdn=None, upndomain=None, ttl=None, max_ttl=None,
                   mount_point=DEFAULT_MOUNT_POINT, *args, **kwargs):
         """Configure shared information for the ad secrets engine.
@@ -40,23 +183,28 @@ class ActiveDirectory(VaultApiBase):
         :return: The response of the request.
         :rtype: requests.Response
         """
-        params = utils.remove_nones({
-            'binddn': binddn,
-            'bindpass': bindpass,
-            'url': url,
-            'userdn': userdn,
-            'upndomain': upndomain,
-            'ttl': ttl,
-            'max_ttl': max_ttl,
-        })
-
-        params.update(kwargs)
-
-        api_path = utils.format_url('/v1/{mount_point}/config', mount_point=mount_point)
-        return self._adapter.post(
+        params = dict(
+            (
+                (key, value) for key, value in (
+                    ('binddn', binddn),
+                    ('bindpass', bindpass),
+                    ('url', url),
+                    ('userdn', userdn),
+                    ('upndomain', upndomain),
+                    ('ttl', ttl),
+                    ('max_ttl', max_ttl),
+                ) if value is not None
+            ),
+            **kwargs
+        )
+
+        api_path = utils.format_url(_CONFIG_PATH, mount_point=mount_point)
+        response = self._adapter.post(
             url=api_path,
             json=params,
         )
+        self._evict_cached(('read_config', mount_point))
+        return response
 
     def read_config(self, mount_point=DEFAULT_MOUNT_POINT):
         """Read the configured shared information for the ad secrets engine.
@@ -71,8 +219,10 @@ class ActiveDirectory(VaultApiBase):
         :return: The JSON response of the request.
         :rtype: dict
         """
-        api_path = utils.format_url('/v1/{mount_point}/config', mount_point=mount_point)
-        return self._adapter.get(
+        api_path = utils.format_url(_CONFIG_PATH, mount_point=mount_point)
+        return self._cached_request(
+            ('read_config', mount_point),
+            self._adapter.get,
             url=api_path,
         )
 
@@ -93,20 +243,20 @@ class ActiveDirectory(VaultApiBase):
         :return: The response of the request.
         :rtype: requests.Response
         """
-        api_path = utils.format_url("/v1/{}/roles/{}", mount_point, name)
+        api_path = utils.format_url(_ROLE_PATH, mount_point, name)
         params = {
             "name": name,
         }
-        params.update(
-            utils.remove_nones({
-                "service_account_name": service_account_name,
-                "ttl": ttl,
-            })
-        )
-        return self._adapter.post(
+        if service_account_name is not None:
+            params["service_account_name"] = service_account_name
+        if ttl is not None:
+            params["ttl"] = ttl
+        response = self._adapter.post(
             url=api_path,
             json=params,
         )
+        self._evict_cached(('read_role', mount_point, name), ('list_roles', mount_point))
+        return response
 
     def read_role(self, name, mount_point=DEFAULT_MOUNT_POINT):
         """This endpoint queries for information about a ad role with the given name.
@@ -118,20 +268,93 @@ class ActiveDirectory(VaultApiBase):
         :return: The response of the request.
         :rtype: requests.Response
         """
-        api_path = utils.format_url("/v1/{}/roles/{}", mount_point, name)
-        return self._adapter.get(
+        api_path = utils.format_url(_ROLE_PATH, mount_point, name)
+        return self._cached_request(
+            ('read_role', mount_point, name),
+            self._adapter.get,
             url=api_path,
         )
 
+    def read_roles_bulk(self, names, mount_point=DEFAULT_MOUNT_POINT, max_workers=DEFAULT_MAX_WORKERS):
+        """Read several ad roles concurrently using a thread pool.
+
+        Threads share the adapter's session, and therefore its pool of keep-alive connections. Requires
+        concurrent.futures (the futures backport on Python 2).
+
+        :param names: The names of the roles to query.
+        :type names: collections.Iterable
+        :param mount_point: Specifies the place where the secrets engine will be accessible (default: ad).
+        :type mount_point: str | unicode
+        :param max_workers: The maximum number of requests in flight at once.
+        :type max_workers: int
+        :return: Mapping of each role name to its response. Exceptions raised for individual roles (e.g.
+            hvac.exceptions.InvalidPath for a missing role) are returned in place of the response.
+        :rtype: dict
+        """
+        if not has_futures:
+            raise ImportError('concurrent.futures is required for bulk reads')
+        names = list(names)
+
+        def read_role(name):
+            try:
+                return self.read_role(name=name, mount_point=mount_point)
+            except Exception as error:
+                return error
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(names, executor.map(read_role, names)))
+
     def list_roles(self, mount_point=DEFAULT_MOUNT_POINT):
         """This endpoint lists all existing roles in the secrets engine.
         :return: The response of the request.
         :rtype: requests.Response
         """
-        api_path = utils.format_url("/v1/{}/roles", mount_point)
-        return self._adapter.list(
+        api_path = utils.format_url(_ROLES_PATH, mount_point)
+        return self._cached_request(
+            ('list_roles', mount_point),
+            self._adapter.list,
+            url=api_path,
+        )
+
+    def list_roles_iter(self, mount_point=DEFAULT_MOUNT_POINT):
+        """Iterate over the names of all existing roles in the secrets engine.
+
+        Unlike list_roles, the response body is streamed and decoded incrementally, so only one role name is held in
+        memory at a time. Requires the ijson package and an adapter based on :py:class:`hvac.adapters.RawAdapter` or
+        :py:class:`hvac.adapters.HTTPXAdapter`.
+
+        The request is only sent once iteration starts, so request errors (e.g. hvac.exceptions.InvalidPath when no
+        roles exist) are raised by the first ``next()`` call rather than by this method.
+
+        :param mount_point: Specifies the place where the secrets engine will be accessible (default: ad).
+        :type mount_point: str | unicode
+        :return: Generator yielding each role name.
+        :rtype: generator
+        """
+        if not has_ijson:
+            raise ImportError('ijson is required for streaming list responses')
+        api_path = utils.format_url(_ROLES_PATH, mount_point)
+        return self._iter_list_keys(api_path)
+
+    def _iter_list_keys(self, api_path):
+        """Perform a streamed LIST request and yield the keys of its response, closing the response once exhausted.
+
+        :param api_path: The path to send the LIST request to.
+        :type api_path: str | unicode
+        :return: Generator yielding each key.
+        :rtype: generator
+        """
+        response = self._adapter.list(
             url=api_path,
+            stream=True,
         )
+        try:
+            # Chunks are already stripped of any gzip/deflate Content-Encoding by the HTTP library.
+            body = _ChunkReader(iter(_iter_response_chunks(response)))
+            for key in ijson.items(body, 'data.keys.item'):
+                yield key
+        finally:
+            response.close()
 
     def delete_role(self, name, mount_point=DEFAULT_MOUNT_POINT):
         """This endpoint deletes a ad role with the given name.
@@ -143,7 +366,9 @@ class ActiveDirectory(VaultApiBase):
         :return: The response of the request.
         :rtype: requests.Response
         """
-        api_path = utils.format_url("/v1/{}/roles/{}", mount_point, name)
-        return self._adapter.delete(
+        api_path = utils.format_url(_ROLE_PATH, mount_point, name)
+        response = self._adapter.delete(
             url=api_path,
         )
+        self._evict_cached(('read_role', mount_point, name), ('list_roles', mount_point))
+        return response
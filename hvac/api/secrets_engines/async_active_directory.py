@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Asynchronous Active Directory methods module."""
+import asyncio
+
+from hvac import utils
+from hvac.api.secrets_engines.active_directory import DEFAULT_MOUNT_POINT, _CONFIG_PATH, _ROLE_PATH, _ROLES_PATH
+from hvac.api.vault_api_base import VaultApiBase
+
+DEFAULT_MAX_CONCURRENCY = 16
+
+
+class AsyncActiveDirectory(VaultApiBase):
+    """Active Directory Secrets Engine (async API).
+
+    Mirrors :py:class:`hvac.api.secrets_engines.ActiveDirectory` with awaitable methods. Must be constructed with an
+    adapter from :py:mod:`hvac.async_adapters`, e.g.::
+
+        async with AsyncJSONAdapter(base_uri=url, token=token) as adapter:
+            ad = AsyncActiveDirectory(adapter=adapter)
+            roles = await asyncio.gather(*(ad.read_role(name) for name in names))
+
+    Reference: https://www.vaultproject.io/api/secret/ad/index.html
+    """
+
+    async def prime(self, n=1):
+        """Establish a connection to the Vault server ahead of the first ad request.
+
+        Issues n concurrent HEAD requests to the health endpoint. The default async adapters use HTTP/2, which
+        multiplexes all requests onto a single connection, so n only has an effect with a caller-provided HTTP/1.1
+        client, where up to n connections may be opened.
+
+        :param n: The number of concurrent health requests to send.
+        :type n: int
+        """
+        await asyncio.gather(*(
+            self._adapter.head('/v1/sys/health', raise_exception=False) for _ in range(n)
+        ))
+
+    async def configure(self, binddn=None, bindpass=None, url=None, userdn=None, upndomain=None, ttl=None, max_ttl=None,
+                        mount_point=DEFAULT_MOUNT_POINT, *args, **kwargs):
+        """Configure shared information for the ad secrets engine.
+
+        See :py:meth:`hvac.api.secrets_engines.ActiveDirectory.configure` for parameter details.
+
+        :return: The response of the request.
+        :rtype: httpx.Response
+        """
+        params = dict(
+            (
+                (key, value) for key, value in (
+                    ('binddn', binddn),
+                    ('bindpass', bindpass),
+                    ('url', url),
+                    ('userdn', userdn),
+                    ('upndomain', upndomain),
+                    ('ttl', ttl),
+                    ('max_ttl', max_ttl),
+                ) if value is not None
+            ),
+            **kwargs
+        )
+
+        api_path = utils.format_url(_CONFIG_PATH, mount_point=mount_point)
+        return await self._adapter.post(
+            url=api_path,
+            json=params,
+        )
+
+    async def read_config(self, mount_point=DEFAULT_MOUNT_POINT):
+        """Read the configured shared information for the ad secrets engine.
+
+        See :py:meth:`hvac.api.secrets_engines.ActiveDirectory.read_config` for parameter details.
+
+        :return: The JSON response of the request.
+        :rtype: dict
+        """
+        api_path = utils.format_url(_CONFIG_PATH, mount_point=mount_point)
+        return await self._adapter.get(
+            url=api_path,
+        )
+
+    async def create_or_update_role(self, name, service_account_name=None, ttl=None, mount_point=DEFAULT_MOUNT_POINT):
+        """This endpoint creates or updates the ad role definition.
+
+        See :py:meth:`hvac.api.secrets_engines.ActiveDirectory.create_or_update_role` for parameter details.
+
+        :return: The response of the request.
+        :rtype: httpx.Response
+        """
+        api_path = utils.format_url(_ROLE_PATH, mount_point, name)
+        params = {
+            "name": name,
+        }
+        if service_account_name is not None:
+            params["service_account_name"] = service_account_name
+        if ttl is not None:
+            params["ttl"] = ttl
+        return await self._adapter.post(
+            url=api_path,
+            json=params,
+        )
+
+    async def read_role(self, name, mount_point=DEFAULT_MOUNT_POINT):
+        """This endpoint queries for information about a ad role with the given name.
+
+        See :py:meth:`hvac.api.secrets_engines.ActiveDirectory.read_role` for parameter details.
+
+        :return: The response of the request.
+        :rtype: httpx.Response
+        """
+        api_path = utils.format_url(_ROLE_PATH, mount_point, name)
+        return await self._adapter.get(
+            url=api_path,
+        )
+
+    async def list_roles(self, mount_point=DEFAULT_MOUNT_POINT):
+        """This endpoint lists all existing roles in the secrets engine.
+
+        :return: The response of the request.
+        :rtype: httpx.Response
+        """
+        api_path = utils.format_url(_ROLES_PATH, mount_point)
+        return await self._adapter.list(
+            url=api_path,
+        )
+
+    async def delete_role(self, name, mount_point=DEFAULT_MOUNT_POINT):
+        """This endpoint deletes a ad role with the given name.
+
+        See :py:meth:`hvac.api.secrets_engines.ActiveDirectory.delete_role` for parameter details.
+
+        :return: The response of the request.
+        :rtype: httpx.Response
+        """
+        api_path = utils.format_url(_ROLE_PATH, mount_point, name)
+        return await self._adapter.delete(
+            url=api_path,
+        )
+
+    async def read_roles_bulk(self, names, mount_point=DEFAULT_MOUNT_POINT, max_concurrency=DEFAULT_MAX_CONCURRENCY):
+        """Read several ad roles concurrently.
+
+        :param names: The names of the roles to query.
+        :type names: collections.Iterable
+        :param mount_point: Specifies the place where the secrets engine will be accessible (default: ad).
+        :type mount_point: str | unicode
+        :param max_concurrency: The maximum number of requests in flight at once.
+        :type max_concurrency: int
+        :return: Mapping of each role name to its response. Exceptions raised for individual roles (e.g.
+            hvac.exceptions.InvalidPath for a missing role) are returned in place of the response.
+        :rtype: dict
+        """
+        names = list(names)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def read_role(name):
+            async with semaphore:
+                return await self.read_role(name=name, mount_point=mount_point)
+
+        responses = await asyncio.gather(
+            *(read_role(name) for name in names),
+            return_exceptions=True
+        )
+        return dict(zip(names, responses))
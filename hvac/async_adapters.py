@@ -0,0 +1,306 @@
+# coding=utf-8
+"""
+Asynchronous HTTP Client Library Adapters
+
+Requires Python 3 and the optional httpx dependency (``pip install hvac[async]``).
+"""
+try:
+    import httpx
+    has_httpx = True
+except ImportError:
+    has_httpx = False
+
+from hvac.adapters import (
+    DEFAULT_BASE_URI,
+    _build_httpx_client_kwargs,
+    _httpx_send_kwargs,
+    _json_or_response,
+    _prepare_request,
+    _raise_for_response,
+    _validate_ssl_context,
+)
+
+
+class AsyncAdapter(object):
+    """Base class used when constructing asynchronous adapters. The async counterpart to :py:class:`hvac.adapters.Adapter`."""
+
+    def __init__(self, base_uri=DEFAULT_BASE_URI, token=None, cert=None, verify=True, timeout=30, proxies=None,
+                 allow_redirects=True, client=None, namespace=None, ignore_exceptions=False, ssl_context=None):
+        """Create a new asynchronous request adapter instance.
+
+        :param base_uri: Base URL for the Vault instance being addressed.
+        :type base_uri: str
+        :param token: Authentication token to include in requests sent to Vault.
+        :type token: str
+        :param cert: Certificates for use in requests sent to the Vault instance. This should be a tuple with the
+            certificate and then key.
+        :type cert: tuple
+        :param verify: Either a boolean to indicate whether TLS verification should be performed when sending requests to Vault,
+            or a string pointing at the CA bundle to use for verification.
+        :type verify: Union[bool,str]
+        :param timeout: The timeout value for requests sent to Vault.
+        :type timeout: int
+        :param proxies: Proxies to use when preforming requests.
+            See: http://docs.python-requests.org/en/master/user/advanced/#proxies
+        :type proxies: dict
+        :param allow_redirects: Whether to follow redirects when sending requests to Vault.
+        :type allow_redirects: bool
+        :param client: Optional client object to use when performing requests. If none is provided, a HTTP/2 enabled
+            client with a pool of keep-alive connections is created.
+        :type client: httpx.AsyncClient
+        :param namespace: Optional Vault Namespace.
+        :type namespace: str
+        :param ignore_exceptions: If True, _always_ return the response object for a given request. I.e., don't raise an exception
+            based on response status code, etc.
+        :type ignore_exceptions: bool
+        :param ssl_context: Optional SSL context to use for HTTPS connections, e.g. to require TLS 1.3. The context
+            replaces the verify and cert parameters: load any custom CA bundle and client certificate into it instead.
+            Cannot be combined with the client, verify or cert parameters.
+        :type ssl_context: ssl.SSLContext
+        """
+        _validate_ssl_context(ssl_context, client, cert, verify)
+        if not client:
+            if not has_httpx:
+                raise ImportError('httpx is required for asynchronous adapters')
+            if ssl_context is not None:
+                verify = ssl_context
+            client = httpx.AsyncClient(
+                **_build_httpx_client_kwargs(cert, verify, timeout, proxies, httpx.AsyncHTTPTransport)
+            )
+
+        self.base_uri = base_uri
+        self.token = token
+        self.namespace = namespace
+        self.client = client
+        self.allow_redirects = allow_redirects
+        self.ignore_exceptions = ignore_exceptions
+
+        self._kwargs = {
+            'timeout': timeout,
+        }
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Close the underlying httpx client and its connection pool.
+        """
+        await self.client.aclose()
+
+    async def get(self, url, **kwargs):
+        """Performs a GET request.
+
+        :param url: Partial URL path to send the request to. This will be joined to the end of the instance's base_uri
+            attribute.
+        :type url: str | unicode
+        :param kwargs: Additional keyword arguments to include in the httpx call.
+        :type kwargs: dict
+        :return: The response of the request.
+        :rtype: httpx.Response
+        """
+        return await self.request('get', url, **kwargs)
+
+    async def post(self, url, **kwargs):
+        """Performs a POST request.
+
+        :param url: Partial URL path to send the request to. This will be joined to the end of the instance's base_uri
+            attribute.
+        :type url: str | unicode
+        :param kwargs: Additional keyword arguments to include in the httpx call.
+        :type kwargs: dict
+        :return: The response of the request.
+        :rtype: httpx.Response
+        """
+        return await self.request('post', url, **kwargs)
+
+    async def put(self, url, **kwargs):
+        """Performs a PUT request.
+
+        :param url: Partial URL path to send the request to. This will be joined to the end of the instance's base_uri
+            attribute.
+        :type url: str | unicode
+        :param kwargs: Additional keyword arguments to include in the httpx call.
+        :type kwargs: dict
+        :return: The response of the request.
+        :rtype: httpx.Response
+        """
+        return await self.request('put', url, **kwargs)
+
+    async def delete(self, url, **kwargs):
+        """Performs a DELETE request.
+
+        :param url: Partial URL path to send the request to. This will be joined to the end of the instance's base_uri
+            attribute.
+        :type url: str | unicode
+        :param kwargs: Additional keyword arguments to include in the httpx call.
+        :type kwargs: dict
+        :return: The response of the request.
+        :rtype: httpx.Response
+        """
+        return await self.request('delete', url, **kwargs)
+
+    async def list(self, url, **kwargs):
+        """Performs a LIST request.
+
+        :param url: Partial URL path to send the request to. This will be joined to the end of the instance's base_uri
+            attribute.
+        :type url: str | unicode
+        :param kwargs: Additional keyword arguments to include in the httpx call.
+        :type kwargs: dict
+        :return: The response of the request.
+        :rtype: httpx.Response
+        """
+        return await self.request('list', url, **kwargs)
+
+    async def head(self, url, **kwargs):
+        """Performs a HEAD request.
+
+        :param url: Partial URL path to send the request to. This will be joined to the end of the instance's base_uri
+            attribute.
+        :type url: str | unicode
+        :param kwargs: Additional keyword arguments to include in the httpx call.
+        :type kwargs: dict
+        :return: The response of the request.
+        :rtype: httpx.Response
+        """
+        return await self.request('head', url, **kwargs)
+
+    async def login(self, url, use_token=True, **kwargs):
+        """Perform a login request.
+
+        :param url: Path to send the authentication request to.
+        :type url: str | unicode
+        :param use_token: if True, uses the token in the response received from the auth request to set the "token"
+            attribute on the adapter instance.
+        :type use_token: bool
+        :param kwargs: Additional keyword arguments to include in the params sent with the request.
+        :type kwargs: dict
+        :return: The response of the auth request.
+        :rtype: httpx.Response
+        """
+        response = await self.post(url, **kwargs)
+
+        if use_token:
+            self.token = self.get_login_token(response)
+
+        return response
+
+    def get_login_token(self, response):
+        """Extracts the client token from a login response.
+
+        :param response: The response object returned by the login method.
+        :return: A client token.
+        :rtype: str
+        """
+        raise NotImplementedError
+
+    async def request(self, method, url, headers=None, raise_exception=True, **kwargs):
+        """Main method for routing HTTP requests to the configured Vault base_uri. Intended to be implement by subclasses.
+
+        :param method: HTTP method to use with the request. E.g., GET, POST, etc.
+        :type method: str
+        :param url: Partial URL path to send the request to. This will be joined to the end of the instance's base_uri
+            attribute.
+        :type url: str | unicode
+        :param headers: Additional headers to include with the request.
+        :type headers: dict
+        :param raise_exception: If True, raise an exception via utils.raise_for_error(). Set this parameter to False to
+            bypass this functionality.
+        :type raise_exception: bool
+        :param kwargs: Additional keyword arguments to include in the httpx call.
+        :type kwargs: dict
+        :return: The response of the request.
+        :rtype: httpx.Response
+        """
+        raise NotImplementedError
+
+
+class AsyncRawAdapter(AsyncAdapter):
+    """
+    The AsyncRawAdapter adapter class.
+    The async counterpart to :py:class:`hvac.adapters.RawAdapter`; always returns Response objects for requests.
+    """
+
+    def get_login_token(self, response):
+        """Extracts the client token from a login response.
+
+        :param response: The response object returned by the login method.
+        :type response: httpx.Response
+        :return: A client token.
+        :rtype: str
+        """
+        response_json = response.json()
+        return response_json['auth']['client_token']
+
+    async def request(self, method, url, headers=None, raise_exception=True, **kwargs):
+        """Main method for routing HTTP requests to the configured Vault base_uri.
+
+        :param method: HTTP method to use with the request. E.g., GET, POST, etc.
+        :type method: str
+        :param url: Partial URL path to send the request to. This will be joined to the end of the instance's base_uri
+            attribute.
+        :type url: str | unicode
+        :param headers: Additional headers to include with the request.
+        :type headers: dict
+        :param raise_exception: If True, raise an exception via utils.raise_for_error(). Set this parameter to False to
+            bypass this functionality.
+        :type raise_exception: bool
+        :param kwargs: Additional keyword arguments to include in the httpx call. The requests-style stream argument and
+            raw (bytes or text) data bodies are translated to their httpx equivalents.
+        :type kwargs: dict
+        :return: The response of the request.
+        :rtype: httpx.Response
+        """
+        url, headers, _kwargs = _prepare_request(self, url, headers, kwargs, self.client.headers)
+        stream, _kwargs = _httpx_send_kwargs(_kwargs)
+
+        request = self.client.build_request(
+            method=method.upper(),
+            url=url,
+            headers=headers,
+            **_kwargs
+        )
+        response = await self.client.send(request, stream=stream, follow_redirects=self.allow_redirects)
+
+        if stream and not response.is_success:
+            await response.aread()
+        _raise_for_response(self, method, url, response, response.is_success, raise_exception)
+
+        return response
+
+
+class AsyncJSONAdapter(AsyncRawAdapter):
+    """
+    The AsyncJSONAdapter adapter class.
+    The async counterpart to :py:class:`hvac.adapters.JSONAdapter`; HTTP 200 responses are returned as JSON dicts.
+    All non-200 responses are returned as Response objects.
+    """
+
+    def get_login_token(self, response):
+        """Extracts the client token from a login response.
+
+        :param response: The response object returned by the login method.
+        :type response: dict | httpx.Response
+        :return: A client token.
+        :rtype: str
+        """
+        return response['auth']['client_token']
+
+    async def request(self, *args, **kwargs):
+        """Main method for routing HTTP requests to the configured Vault base_uri.
+
+        :param args: Positional arguments to pass to AsyncRawAdapter.request.
+        :type args: list
+        :param kwargs: Keyword arguments to pass to AsyncRawAdapter.request.
+        :type kwargs: dict
+        :return: Dict on HTTP 200 with JSON body, otherwise the response object.
+        :rtype: dict | httpx.Response
+        """
+        response = await super(AsyncJSONAdapter, self).request(*args, **kwargs)
+        if kwargs.get('stream'):
+            return response
+
+        return _json_or_response(response)
@@ -307,6 +307,19 @@ def remove_nones(params):
     }
 
 
+if six.PY2:
+    def _url_quote(maybe_str):
+        # Special care must be taken for Python 2 where Unicode characters will break urllib quoting.
+        # To work around this, we always cast to a Unicode type, then UTF-8 encode it.
+        unicode_str = six.text_type(maybe_str)
+        utf8_str = unicode_str.encode("utf-8")
+        return six.moves.urllib.parse.quote(utf8_str)
+else:
+    def _url_quote(maybe_str):
+        # Python 3's quote() already UTF-8 encodes str arguments, so skip the intermediate encode.
+        return six.moves.urllib.parse.quote(str(maybe_str))
+
+
 def format_url(format_str, *args, **kwargs):
     """Creates a URL using the specified format after escaping the provided arguments.
 
@@ -319,17 +332,8 @@ def format_url(format_str, *args, **kwargs):
     :return: The formatted URL path with escaped replacement fields.
     :rtype: str
     """
-
-    def url_quote(maybe_str):
-        # Special care must be taken for Python 2 where Unicode characters will break urllib quoting.
-        # To work around this, we always cast to a Unicode type, then UTF-8 encode it.
-        # Doing this is version agnostic and returns the same result in Python 2 or 3.
-        unicode_str = six.text_type(maybe_str)
-        utf8_str = unicode_str.encode("utf-8")
-        return six.moves.urllib.parse.quote(utf8_str)
-
-    escaped_args = [url_quote(value) for value in args]
-    escaped_kwargs = {key: url_quote(value) for key, value in kwargs.items()}
+    escaped_args = [_url_quote(value) for value in args]
+    escaped_kwargs = {key: _url_quote(value) for key, value in kwargs.items()}
 
     return format_str.format(
         *escaped_args,
@@ -35,6 +35,9 @@ setup(
     include_package_data=True,
     package_data={'hvac': ['version']},
     extras_require={
-        'parser': ['pyhcl>=0.3.10']
-    }
+        'parser': ['pyhcl>=0.3.10'],
+        'cache': ['cachetools'],
+        'stream': ['ijson'],
+        'async': ['httpx[http2]>=0.20.0; python_version >= "3.6"'],
+    },
 )
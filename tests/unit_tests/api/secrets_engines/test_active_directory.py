@@ -0,0 +1,320 @@
+from unittest import TestCase
+from unittest import skipIf
+
+import requests
+import requests_mock
+from parameterized import parameterized
+
+from hvac import exceptions
+from hvac import adapters
+from hvac.adapters import JSONAdapter
+from hvac.api.secrets_engines import active_directory
+from hvac.api.secrets_engines.active_directory import ActiveDirectory, DEFAULT_MOUNT_POINT
+
+
+class TestActiveDirectory(TestCase):
+
+    @parameterized.expand([
+        ('cache disabled', None, 2),
+        ('cache enabled', 60, 1),
+    ])
+    @requests_mock.Mocker()
+    def test_read_role(self, test_label, cache_ttl, expected_call_count, requests_mocker):
+        if cache_ttl is not None and not active_directory.has_cachetools:
+            self.skipTest('cachetools is required for response caching')
+        mock_response = {'data': {'service_account_name': 'hvac@example.com'}}
+        mock_url = 'http://localhost:8200/v1/{mount_point}/roles/{name}'.format(
+            mount_point=DEFAULT_MOUNT_POINT,
+            name='hvac',
+        )
+        requests_mocker.register_uri(
+            method='GET',
+            url=mock_url,
+            json=mock_response,
+        )
+        ad = ActiveDirectory(adapter=JSONAdapter(), cache_ttl=cache_ttl)
+
+        for _ in range(2):
+            read_role_response = ad.read_role(name='hvac')
+
+        self.assertEqual(
+            first=mock_response,
+            second=read_role_response,
+        )
+        self.assertEqual(
+            first=expected_call_count,
+            second=requests_mocker.call_count,
+        )
+
+    @skipIf(not active_directory.has_cachetools, 'cachetools is required for response caching')
+    @requests_mock.Mocker()
+    def test_create_or_update_role_evicts_cache(self, requests_mocker):
+        mock_url = 'http://localhost:8200/v1/{mount_point}/roles'.format(
+            mount_point=DEFAULT_MOUNT_POINT,
+        )
+        requests_mocker.register_uri(
+            method='LIST',
+            url=mock_url,
+            json={'data': {'keys': ['hvac']}},
+        )
+        requests_mocker.register_uri(
+            method='POST',
+            url=mock_url + '/hvac2',
+            status_code=204,
+        )
+        ad = ActiveDirectory(adapter=JSONAdapter(), cache_ttl=60)
+
+        ad.list_roles()
+        ad.list_roles()
+        ad.create_or_update_role(name='hvac2', service_account_name='hvac2@example.com')
+        ad.list_roles()
+
+        self.assertEqual(
+            first=['LIST', 'POST', 'LIST'],
+            second=[request.method for request in requests_mocker.request_history],
+        )
+
+    @parameterized.expand([
+        ('no connections', 0),
+        ('single connection', 1),
+        ('several connections', 4),
+    ])
+    @requests_mock.Mocker()
+    def test_prime(self, test_label, n, requests_mocker):
+        requests_mocker.register_uri(
+            method='HEAD',
+            url='http://localhost:8200/v1/sys/health',
+            status_code=429,
+        )
+        ad = ActiveDirectory(adapter=JSONAdapter())
+
+        ad.prime(n=n)
+
+        self.assertEqual(
+            first=n,
+            second=requests_mocker.call_count,
+        )
+
+    @parameterized.expand([
+        ('default mount point', DEFAULT_MOUNT_POINT),
+        ('custom mount point', 'other-ad'),
+    ])
+    @requests_mock.Mocker()
+    def test_delete_role(self, test_label, mount_point, requests_mocker):
+        expected_status_code = 204
+        mock_url = 'http://localhost:8200/v1/{mount_point}/roles/{name}'.format(
+            mount_point=mount_point,
+            name='hvac',
+        )
+        requests_mocker.register_uri(
+            method='DELETE',
+            url=mock_url,
+            status_code=expected_status_code,
+        )
+        ad = ActiveDirectory(adapter=JSONAdapter())
+
+        delete_role_response = ad.delete_role(name='hvac', mount_point=mount_point)
+
+        self.assertEqual(
+            first=expected_status_code,
+            second=delete_role_response.status_code,
+        )
+
+    @parameterized.expand([
+        ('name only', {}, {'name': 'hvac'}),
+        ('with ttl', {'ttl': '1h'}, {'name': 'hvac', 'ttl': '1h'}),
+        ('with service account', {'service_account_name': 'hvac@example.com'},
+         {'name': 'hvac', 'service_account_name': 'hvac@example.com'}),
+    ])
+    @requests_mock.Mocker()
+    def test_create_or_update_role(self, test_label, kwargs, expected_params, requests_mocker):
+        mock_url = 'http://localhost:8200/v1/{mount_point}/roles/{name}'.format(
+            mount_point=DEFAULT_MOUNT_POINT,
+            name='hvac',
+        )
+        requests_mocker.register_uri(
+            method='POST',
+            url=mock_url,
+            status_code=204,
+        )
+        ad = ActiveDirectory(adapter=JSONAdapter())
+
+        ad.create_or_update_role(name='hvac', **kwargs)
+
+        self.assertEqual(
+            first=expected_params,
+            second=requests_mocker.request_history[0].json(),
+        )
+
+    @skipIf(not active_directory.has_ijson, 'ijson is required for streaming list responses')
+    @requests_mock.Mocker()
+    def test_list_roles_iter(self, requests_mocker):
+        role_names = ['hvac1', 'hvac2', 'hvac3']
+        mock_url = 'http://localhost:8200/v1/{mount_point}/roles'.format(
+            mount_point=DEFAULT_MOUNT_POINT,
+        )
+        requests_mocker.register_uri(
+            method='LIST',
+            url=mock_url,
+            json={'data': {'keys': role_names}},
+        )
+        ad = ActiveDirectory(adapter=JSONAdapter())
+
+        list_roles_iter_response = ad.list_roles_iter()
+        self.assertFalse(requests_mocker.called)
+
+        self.assertEqual(
+            first=role_names,
+            second=list(list_roles_iter_response),
+        )
+
+    @skipIf(not active_directory.has_ijson, 'ijson is required for streaming list responses')
+    @skipIf(not adapters.has_httpx, 'httpx is required for the httpx adapter')
+    def test_list_roles_iter_httpx(self):
+        import httpx
+
+        role_names = ['hvac1', 'hvac2', 'hvac3']
+        sent_requests = []
+
+        def handler(request):
+            sent_requests.append(request)
+            return httpx.Response(status_code=200, json={'data': {'keys': role_names}})
+
+        session = httpx.Client(transport=httpx.MockTransport(handler))
+        ad = ActiveDirectory(adapter=adapters.HTTPXAdapter(session=session))
+
+        self.assertEqual(
+            first=role_names,
+            second=list(ad.list_roles_iter()),
+        )
+        self.assertEqual(
+            first='LIST',
+            second=sent_requests[0].method,
+        )
+
+    @skipIf(not active_directory.has_futures, 'concurrent.futures is required for bulk reads')
+    @requests_mock.Mocker()
+    def test_read_roles_bulk(self, requests_mocker):
+        role_names = ['hvac1', 'hvac2', 'hvac3']
+        for role_name in role_names:
+            requests_mocker.register_uri(
+                method='GET',
+                url='http://localhost:8200/v1/{mount_point}/roles/{name}'.format(
+                    mount_point=DEFAULT_MOUNT_POINT,
+                    name=role_name,
+                ),
+                json={'data': {'name': role_name}},
+            )
+        requests_mocker.register_uri(
+            method='GET',
+            url='http://localhost:8200/v1/{mount_point}/roles/missing'.format(mount_point=DEFAULT_MOUNT_POINT),
+            status_code=404,
+        )
+        ad = ActiveDirectory(adapter=JSONAdapter())
+
+        read_roles_bulk_response = ad.read_roles_bulk(
+            names=(role_name for role_name in role_names + ['missing']),
+            max_workers=2,
+        )
+
+        self.assertIsInstance(read_roles_bulk_response.pop('missing'), exceptions.InvalidPath)
+        self.assertEqual(
+            first={role_name: {'data': {'name': role_name}} for role_name in role_names},
+            second=read_roles_bulk_response,
+        )
+
+    @parameterized.expand([
+        ('no extra parameters', {}, {'binddn': 'cn=vault', 'ttl': 60}),
+        ('extra parameters', {'insecure_tls': True}, {'binddn': 'cn=vault', 'ttl': 60, 'insecure_tls': True}),
+    ])
+    @requests_mock.Mocker()
+    def test_configure(self, test_label, kwargs, expected_params, requests_mocker):
+        requests_mocker.register_uri(
+            method='POST',
+            url='http://localhost:8200/v1/{mount_point}/config'.format(mount_point=DEFAULT_MOUNT_POINT),
+            status_code=204,
+        )
+        ad = ActiveDirectory(adapter=JSONAdapter())
+
+        ad.configure(binddn='cn=vault', ttl=60, **kwargs)
+
+        self.assertEqual(
+            first=expected_params,
+            second=requests_mocker.request_history[0].json(),
+        )
+
+    @skipIf(not active_directory.has_cachetools, 'cachetools is required for response caching')
+    @requests_mock.Mocker()
+    def test_read_role_cache_is_per_token(self, requests_mocker):
+        requests_mocker.register_uri(
+            method='GET',
+            url='http://localhost:8200/v1/{mount_point}/roles/hvac'.format(mount_point=DEFAULT_MOUNT_POINT),
+            json={'data': {}},
+        )
+        ad = ActiveDirectory(adapter=JSONAdapter(token='token-a'), cache_ttl=60)
+
+        ad.read_role(name='hvac')
+        ad._adapter.token = 'token-b'
+        ad.read_role(name='hvac')
+
+        self.assertEqual(
+            first=['token-a', 'token-b'],
+            second=[request.headers['X-Vault-Token'] for request in requests_mocker.request_history],
+        )
+
+    @skipIf(not active_directory.has_cachetools, 'cachetools is required for response caching')
+    @requests_mock.Mocker()
+    def test_read_role_cache_returns_copies(self, requests_mocker):
+        requests_mocker.register_uri(
+            method='GET',
+            url='http://localhost:8200/v1/{mount_point}/roles/hvac'.format(mount_point=DEFAULT_MOUNT_POINT),
+            json={'data': {'ttl': 60}},
+        )
+        ad = ActiveDirectory(adapter=JSONAdapter(), cache_ttl=60)
+
+        ad.read_role(name='hvac')['data']['ttl'] = 0
+        cached_response = ad.read_role(name='hvac')
+        cached_response['data']['ttl'] = 0
+
+        self.assertEqual(
+            first={'data': {'ttl': 60}},
+            second=ad.read_role(name='hvac'),
+        )
+        self.assertEqual(
+            first=1,
+            second=requests_mocker.call_count,
+        )
+
+    @skipIf(not active_directory.has_cachetools, 'cachetools is required for response caching')
+    @requests_mock.Mocker()
+    def test_read_role_cache_skips_non_json_responses(self, requests_mocker):
+        requests_mocker.register_uri(
+            method='GET',
+            url='http://localhost:8200/v1/{mount_point}/roles/hvac'.format(mount_point=DEFAULT_MOUNT_POINT),
+            status_code=404,
+        )
+        ad = ActiveDirectory(adapter=JSONAdapter(ignore_exceptions=True), cache_ttl=60)
+
+        ad.read_role(name='hvac')
+        ad.read_role(name='hvac')
+
+        self.assertEqual(
+            first=2,
+            second=requests_mocker.call_count,
+        )
+
+    @parameterized.expand([
+        ('single connection', 1),
+        ('several connections', 4),
+    ])
+    @requests_mock.Mocker()
+    def test_prime_connection_error(self, test_label, n, requests_mocker):
+        requests_mocker.register_uri(
+            method='HEAD',
+            url='http://localhost:8200/v1/sys/health',
+            exc=requests.exceptions.ConnectionError,
+        )
+        ad = ActiveDirectory(adapter=JSONAdapter())
+
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            ad.prime(n=n)
@@ -0,0 +1,147 @@
+import asyncio
+from unittest import TestCase, skipIf
+
+from parameterized import parameterized
+
+try:
+    import httpx
+    from hvac import exceptions
+    from hvac.async_adapters import AsyncJSONAdapter
+    from hvac.api.secrets_engines.async_active_directory import AsyncActiveDirectory
+except ImportError:
+    httpx = None
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+@skipIf(httpx is None, "httpx is required for the asynchronous adapters")
+class TestAsyncActiveDirectory(TestCase):
+
+    def setUp(self):
+        self.requests = []
+
+    def build_adapter(self, status_code=200, json=None):
+        def handler(request):
+            self.requests.append(request)
+            return httpx.Response(status_code=status_code, json=json)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return AsyncJSONAdapter(client=client)
+
+    @parameterized.expand([
+        ('default mount point', 'ad'),
+        ('custom mount point', 'other-ad'),
+    ])
+    def test_read_role(self, test_label, mount_point):
+        mock_response = {'data': {'service_account_name': 'hvac@example.com'}}
+        adapter = self.build_adapter(json=mock_response)
+        ad = AsyncActiveDirectory(adapter=adapter)
+
+        read_role_response = run(ad.read_role(name='hvac', mount_point=mount_point))
+
+        self.assertEqual(
+            first=mock_response,
+            second=read_role_response,
+        )
+        self.assertEqual(
+            first='GET',
+            second=self.requests[0].method,
+        )
+        self.assertEqual(
+            first='http://localhost:8200/v1/{mount_point}/roles/hvac'.format(mount_point=mount_point),
+            second=str(self.requests[0].url),
+        )
+
+    def test_list_roles(self):
+        mock_response = {'data': {'keys': ['hvac']}}
+        adapter = self.build_adapter(json=mock_response)
+        ad = AsyncActiveDirectory(adapter=adapter)
+
+        list_roles_response = run(ad.list_roles())
+
+        self.assertEqual(
+            first=mock_response,
+            second=list_roles_response,
+        )
+        self.assertEqual(
+            first='LIST',
+            second=self.requests[0].method,
+        )
+
+    def test_delete_role(self):
+        expected_status_code = 204
+        adapter = self.build_adapter(status_code=expected_status_code)
+        ad = AsyncActiveDirectory(adapter=adapter)
+
+        delete_role_response = run(ad.delete_role(name='hvac'))
+
+        self.assertEqual(
+            first=expected_status_code,
+            second=delete_role_response.status_code,
+        )
+        self.assertEqual(
+            first='DELETE',
+            second=self.requests[0].method,
+        )
+
+    def test_concurrent_reads_and_context_manager(self):
+        role_names = ['hvac1', 'hvac2', 'hvac3']
+        adapter = self.build_adapter(json={'data': {}})
+
+        async def read_roles():
+            async with adapter:
+                ad = AsyncActiveDirectory(adapter=adapter)
+                return await asyncio.gather(*(ad.read_role(name=name) for name in role_names))
+
+        responses = run(read_roles())
+
+        self.assertEqual(
+            first=len(role_names),
+            second=len(responses),
+        )
+        self.assertEqual(
+            first=sorted('/v1/ad/roles/{}'.format(name) for name in role_names),
+            second=sorted(request.url.path for request in self.requests),
+        )
+        self.assertTrue(adapter.client.is_closed)
+
+    def test_read_roles_bulk(self):
+        role_names = ['hvac1', 'hvac2', 'missing']
+
+        def handler(request):
+            self.requests.append(request)
+            if request.url.path.endswith('/missing'):
+                return httpx.Response(status_code=404, json={'errors': []})
+            return httpx.Response(status_code=200, json={'data': {'name': request.url.path}})
+
+        adapter = AsyncJSONAdapter(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        ad = AsyncActiveDirectory(adapter=adapter)
+
+        responses = run(ad.read_roles_bulk(names=(name for name in role_names), max_concurrency=2))
+
+        self.assertEqual(
+            first=role_names,
+            second=list(responses),
+        )
+        self.assertEqual(
+            first={'data': {'name': '/v1/ad/roles/hvac1'}},
+            second=responses['hvac1'],
+        )
+        self.assertIsInstance(responses['missing'], exceptions.InvalidPath)
+
+    def test_prime(self):
+        adapter = self.build_adapter(status_code=429)
+        ad = AsyncActiveDirectory(adapter=adapter)
+
+        run(ad.prime(n=3))
+
+        self.assertEqual(
+            first=['HEAD'] * 3,
+            second=[request.method for request in self.requests],
+        )
@@ -1,12 +1,18 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 import logging
-from unittest import TestCase
+import ssl
+from unittest import TestCase, skipIf
 
+import requests
 import requests_mock
 from parameterized import parameterized, param
 
-from hvac import adapters
+from hvac import adapters, exceptions
+from tests.utils import get_config_file_path
+
+if adapters.has_httpx:
+    import httpx
 
 
 class TestRequest(TestCase):
@@ -112,3 +118,255 @@ class TestRequest(TestCase):
             first=mock_response,
             second=response.json()
         )
+
+    @parameterized.expand([
+        ("http", 'http://localhost:8200'),
+        ("https", 'https://localhost:8200'),
+    ])
+    def test_default_session_connection_pool(self, test_label, url):
+        adapter = adapters.RawAdapter(base_uri=url)
+        pool_adapter = adapter.session.get_adapter(url)
+        self.assertEqual(
+            first=adapters.DEFAULT_POOL_MAXSIZE,
+            second=pool_adapter._pool_maxsize,
+        )
+        self.assertEqual(
+            first=adapters.DEFAULT_POOL_CONNECTIONS,
+            second=pool_adapter._pool_connections,
+        )
+
+    def test_provided_session_is_not_modified(self):
+        session = requests.Session()
+        default_pool_adapter = session.get_adapter('https://localhost:8200')
+        adapter = adapters.RawAdapter(session=session)
+        self.assertIs(
+            default_pool_adapter,
+            adapter.session.get_adapter('https://localhost:8200'),
+        )
+
+    def test_ssl_context(self):
+        ssl_context = ssl.create_default_context()
+        adapter = adapters.RawAdapter(base_uri='https://localhost:8200', ssl_context=ssl_context)
+        pool_adapter = adapter.session.get_adapter('https://localhost:8200')
+        self.assertEqual(
+            first=adapters.DEFAULT_POOL_MAXSIZE,
+            second=pool_adapter._pool_maxsize,
+        )
+        request = requests.Request('GET', 'https://localhost:8200/v1/sys/health').prepare()
+        if hasattr(pool_adapter, 'get_connection_with_tls_context'):
+            connection_pool = pool_adapter.get_connection_with_tls_context(request, verify=True)
+        else:
+            connection_pool = pool_adapter.get_connection(request.url)
+        self.assertIs(
+            ssl_context,
+            connection_pool.conn_kw['ssl_context'],
+        )
+
+    def test_ssl_context_is_not_modified(self):
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+        adapter = adapters.RawAdapter(base_uri='https://localhost:8200', ssl_context=ssl_context)
+        pool_adapter = adapter.session.get_adapter('https://localhost:8200')
+        request = requests.Request('GET', 'https://localhost:8200/v1/sys/health').prepare()
+        # e.g. the verify value requests derives from the REQUESTS_CA_BUNDLE environment variable.
+        ca_bundle = get_config_file_path('ca-cert.pem')
+        if hasattr(pool_adapter, 'get_connection_with_tls_context'):
+            connection_pool = pool_adapter.get_connection_with_tls_context(request, verify=ca_bundle)
+        else:
+            connection_pool = pool_adapter.get_connection(request.url)
+        pool_adapter.cert_verify(connection_pool, request.url, verify=ca_bundle, cert=None)
+        self.assertIsNone(connection_pool.ca_certs)
+        self.assertEqual(
+            first=ssl.CERT_NONE,
+            second=connection_pool.cert_reqs,
+        )
+
+    @parameterized.expand([
+        ("custom ca bundle", {'verify': '/path/to/ca.pem'}),
+        ("verification disabled", {'verify': False}),
+        ("client certificate", {'cert': ('client-cert.pem', 'client-key.pem')}),
+    ])
+    def test_ssl_context_with_verify_or_cert(self, test_label, kwargs):
+        with self.assertRaises(exceptions.ParamValidationError):
+            adapters.RawAdapter(ssl_context=ssl.create_default_context(), **kwargs)
+
+    def test_ssl_context_with_provided_session(self):
+        session = requests.Session()
+        default_pool_adapter = session.get_adapter('https://localhost:8200')
+        with self.assertRaises(exceptions.ParamValidationError):
+            adapters.RawAdapter(session=session, ssl_context=ssl.create_default_context())
+        self.assertIs(
+            default_pool_adapter,
+            session.get_adapter('https://localhost:8200'),
+        )
+
+    @parameterized.expand([
+        ("default session", None, adapters.DEFAULT_ACCEPT_ENCODING),
+        ("session without accept-encoding", {}, adapters.DEFAULT_ACCEPT_ENCODING),
+        ("session with custom accept-encoding", {'Accept-Encoding': 'gzip'}, 'gzip'),
+    ])
+    @requests_mock.Mocker()
+    def test_accept_encoding(self, test_label, session_headers, expected_accept_encoding, requests_mocker):
+        session = None
+        if session_headers is not None:
+            session = requests.Session()
+            session.headers.clear()
+            session.headers.update(session_headers)
+        requests_mocker.register_uri(
+            method='GET',
+            url='{0}/v1/sys/health'.format(adapters.DEFAULT_BASE_URI),
+        )
+        adapter = adapters.RawAdapter(session=session)
+        adapter.get(url='v1/sys/health')
+        self.assertIn(
+            member=expected_accept_encoding,
+            container=requests_mocker.request_history[0].headers['Accept-Encoding'],
+        )
+        if session is not None:
+            self.assertEqual(
+                first=session_headers,
+                second=dict(session.headers),
+            )
+
+
+@skipIf(not adapters.has_httpx, "httpx is required for the HTTPXAdapter")
+class TestHTTPXAdapter(TestCase):
+    """Unit tests providing coverage for the httpx-based adapter."""
+
+    def build_adapter(self, handler, **kwargs):
+        session = httpx.Client(transport=httpx.MockTransport(handler))
+        return adapters.HTTPXAdapter(session=session, **kwargs)
+
+    @parameterized.expand([
+        ("kv secret lookup", 'v1/secret/some-secret'),
+    ])
+    def test_list(self, test_label, test_path):
+        mock_response = {
+            'data': {
+                'keys': ['things1', 'things2']
+            },
+        }
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(status_code=200, json=mock_response)
+
+        adapter = self.build_adapter(handler, token='some-token')
+        response = adapter.list(
+            url=test_path,
+        )
+        self.assertEqual(
+            first=mock_response,
+            second=response,
+        )
+        self.assertEqual(
+            first='LIST',
+            second=requests[0].method,
+        )
+        self.assertEqual(
+            first='{0}/{1}'.format(adapters.DEFAULT_BASE_URI, test_path),
+            second=str(requests[0].url),
+        )
+        self.assertEqual(
+            first='some-token',
+            second=requests[0].headers['X-Vault-Token'],
+        )
+
+    def test_error_response(self):
+        def handler(request):
+            return httpx.Response(status_code=404, json={'errors': []})
+
+        adapter = self.build_adapter(handler)
+        with self.assertRaises(exceptions.InvalidPath):
+            adapter.get(url='v1/secret/missing')
+
+    def test_stream(self):
+        def handler(request):
+            return httpx.Response(status_code=200, content=b'snapshot-bytes')
+
+        adapter = self.build_adapter(handler)
+        response = adapter.get(url='v1/sys/storage/raft/snapshot', stream=True)
+
+        self.assertEqual(
+            first=b'snapshot-bytes',
+            second=b''.join(response.iter_bytes()),
+        )
+
+    def test_stream_error_response(self):
+        def handler(request):
+            return httpx.Response(status_code=404, json={'errors': ['no handler for route']})
+
+        adapter = self.build_adapter(handler)
+        with self.assertRaises(exceptions.InvalidPath):
+            adapter.get(url='v1/sys/storage/raft/snapshot', stream=True)
+
+    def test_raw_data_body(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(status_code=204)
+
+        adapter = self.build_adapter(handler)
+        adapter.post(url='v1/sys/storage/raft/snapshot', data=b'snapshot-bytes')
+
+        self.assertEqual(
+            first=b'snapshot-bytes',
+            second=requests[0].content,
+        )
+
+    @parameterized.expand([
+        ("custom ca bundle", {'verify': '/path/to/ca.pem'}),
+        ("client certificate", {'cert': ('client-cert.pem', 'client-key.pem')}),
+    ])
+    def test_ssl_context_with_verify_or_cert(self, test_label, kwargs):
+        with self.assertRaises(exceptions.ParamValidationError):
+            adapters.HTTPXAdapter(ssl_context=ssl.create_default_context(), **kwargs)
+
+    def test_unsupported_request_kwargs(self):
+        adapter = self.build_adapter(lambda request: httpx.Response(status_code=204))
+        with self.assertRaises(exceptions.ParamValidationError):
+            adapter.get(url='v1/sys/health', verify=False)
+
+    @parameterized.expand([
+        ("no proxies", None, []),
+        ("scheme proxies", {'https': 'http://proxy:3128'}, ['https://']),
+        ("url pattern proxies", {'all://': 'http://proxy:3128'}, ['all://']),
+    ])
+    def test_build_httpx_client_kwargs(self, test_label, proxies, expected_mounts):
+        client_kwargs = adapters._build_httpx_client_kwargs(
+            cert=None,
+            verify=True,
+            timeout=30,
+            proxies=proxies,
+            transport_class=httpx.HTTPTransport,
+        )
+        self.assertTrue(client_kwargs['http2'])
+        self.assertEqual(
+            first=expected_mounts,
+            second=list(client_kwargs.get('mounts', {})),
+        )
+        httpx.Client(**client_kwargs).close()
+        self.assertEqual(
+            first=adapters.DEFAULT_HTTPX_MAX_KEEPALIVE_CONNECTIONS,
+            second=client_kwargs['limits'].max_keepalive_connections,
+        )
+
+    @parameterized.expand([
+        ("default verification", None, True, bool),
+        ("ca bundle", None, get_config_file_path('ca-cert.pem'), ssl.SSLContext),
+        ("client certificate", (get_config_file_path('client-cert.pem'), get_config_file_path('client-key.pem')),
+         True, ssl.SSLContext),
+        ("client certificate without verification",
+         (get_config_file_path('client-cert.pem'), get_config_file_path('client-key.pem')), False, ssl.SSLContext),
+    ])
+    def test_build_httpx_ssl_context(self, test_label, cert, verify, expected_type):
+        httpx_verify = adapters._build_httpx_ssl_context(cert=cert, verify=verify)
+        self.assertIsInstance(httpx_verify, expected_type)
+        if verify is False:
+            self.assertEqual(
+                first=ssl.CERT_NONE,
+                second=httpx_verify.verify_mode,
+            )